@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
+from operator import attrgetter
 from typing import Dict, List, Optional, Type
 
 import typer
@@ -190,7 +191,7 @@ class CommandRegistry:
         commands = list(self._commands.values())
         if not include_hidden:
             commands = [cmd for cmd in commands if not cmd.hidden]
-        return sorted(commands, key=lambda x: x.name)
+        return sorted(commands, key=attrgetter("name"))
 
     def create_command_instance(self, name: str) -> Optional[BaseCommand]:
         """
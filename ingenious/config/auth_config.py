@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import os
+import threading
 from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Union
 
 from ingenious.common.enums import AuthenticationMethod
@@ -13,10 +15,14 @@ if TYPE_CHECKING:
 def _get(obj: Any, *names: str) -> Optional[Any]:
     if obj is None:
         return None
-    if isinstance(obj, Mapping):
+    # Plain dicts are the common case; check the exact type first so the
+    # collections.abc registry is only consulted for other mapping types.
+    if type(obj) is dict or isinstance(obj, Mapping):
+        get = obj.get
         for n in names:
-            if n in obj and obj[n] is not None:
-                return obj[n]
+            val = get(n)
+            if val is not None:
+                return val
         return None
     for n in names:
         val = getattr(obj, n, None)
@@ -25,6 +31,59 @@ def _get(obj: Any, *names: str) -> Optional[Any]:
     return None
 
 
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+_BG_TOKEN_TIMEOUT_S = 30.0
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return a process-wide event loop running on a daemon thread.
+
+    Async credentials keep an aiohttp session bound to the loop that first
+    used them; running every token request on one long-lived loop keeps that
+    session (and its connection pool) alive instead of tearing it down with a
+    throwaway loop per call.
+    """
+    global _BG_LOOP
+    loop = _BG_LOOP
+    if loop is not None:
+        return loop
+    with _BG_LOOP_LOCK:
+        if _BG_LOOP is None:
+            new_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=new_loop.run_forever,
+                name="ingenious-azure-auth-loop",
+                daemon=True,
+            ).start()
+            _BG_LOOP = new_loop
+        return _BG_LOOP
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _token_cache_kwargs() -> dict[str, Any]:
+    """
+    Opt-in persistent MSAL token cache for service-principal credentials.
+
+    Set ``INGENIOUS_AZURE_TOKEN_CACHE_NAME`` to persist tokens across process
+    restarts. Persistence needs platform encryption (e.g. libsecret on Linux),
+    so it is never enabled implicitly. Older azure-identity releases without
+    ``TokenCachePersistenceOptions`` silently fall back to the in-memory cache.
+    """
+    name = os.getenv("INGENIOUS_AZURE_TOKEN_CACHE_NAME", "").strip()
+    if not name:
+        return {}
+    try:
+        from azure.identity import TokenCachePersistenceOptions
+    except ImportError:
+        return {}
+    return {"cache_persistence_options": TokenCachePersistenceOptions(name=name)}
+
+
 class AzureAuthConfig:
     """
     Centralized auth configuration for Azure client builders.
@@ -74,6 +133,25 @@ class AzureAuthConfig:
         # Optional API version if present in config
         object.__setattr__(self, "api_version", None)
 
+    def auth_key(self) -> tuple[Any, ...]:
+        """Return a hashable tuple of the auth fields, for keying client caches.
+
+        Equality is deliberately not overridden: config models in
+        ingenious/models/profile.py mix this class in ahead of BaseModel, so an
+        __eq__/__hash__ here would replace their field-wise comparison.
+        """
+        return (
+            self.authentication_method,
+            self.api_key,
+            self.client_id,
+            self.client_secret,
+            self.tenant_id,
+            self.endpoint,
+            self.openai_key,
+            self.openai_endpoint,
+            self.api_version,
+        )
+
     @classmethod
     def default_credential(cls) -> "AzureAuthConfig":
         return cls(authentication_method=AuthenticationMethod.DEFAULT_CREDENTIAL)
@@ -191,6 +269,7 @@ class AzureAuthConfig:
                     tenant_id=str(self.tenant_id),
                     client_id=str(self.client_id),
                     client_secret=str(self.client_secret),
+                    **_token_cache_kwargs(),
                 )
             elif (
                 self.authentication_method == AuthenticationMethod.MSI
@@ -235,6 +314,7 @@ class AzureAuthConfig:
                     tenant_id=str(self.tenant_id),
                     client_id=str(self.client_id),
                     client_secret=str(self.client_secret),
+                    **_token_cache_kwargs(),
                 )
             elif (
                 self.authentication_method == AuthenticationMethod.MSI
@@ -255,17 +335,11 @@ class AzureAuthConfig:
         def _sync_provider() -> str:
             token_or_coro = aio_provider()
             if inspect.isawaitable(token_or_coro):
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        new_loop = asyncio.new_event_loop()
-                        try:
-                            return new_loop.run_until_complete(token_or_coro)
-                        finally:
-                            new_loop.close()
-                    return loop.run_until_complete(token_or_coro)
-                except RuntimeError:
-                    return asyncio.run(token_or_coro)
+                future = asyncio.run_coroutine_threadsafe(
+                    _await(token_or_coro), _background_loop()
+                )
+                token: str = future.result(timeout=_BG_TOKEN_TIMEOUT_S)
+                return token
             return token_or_coro  # type: ignore[unreachable]
 
         return _sync_provider
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, AsyncIterator, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Final, NoReturn, Optional
 
 from openai import NOT_GIVEN, BadRequestError
 from openai.types.chat import (
@@ -11,6 +12,7 @@ from openai.types.chat import (
     ChatCompletionToolChoiceOptionParam,
     ChatCompletionToolParam,
 )
+from openai.types.shared_params import ResponseFormatJSONObject
 
 from ingenious.client.azure import AzureClientFactory
 from ingenious.common.enums import AuthenticationMethod
@@ -20,6 +22,48 @@ from ingenious.errors.token_limit_exceeded_error import TokenLimitExceededError
 
 logger = get_logger(__name__)
 
+# Token limit (AOAI-style) error message, compiled once for both generate paths.
+TOKEN_ERROR_RE = re.compile(
+    r"This model's maximum context length is (\d+) tokens, "
+    r"however you requested (\d+) tokens \((\d+) in your prompt; "
+    r"(\d+) for the completion\)\. Please reduce your prompt; or "
+    r"completion length\."
+)
+
+# Shared request payload for json_mode; the SDK only reads it.
+_JSON_OBJECT_FMT: Final[ResponseFormatJSONObject] = {"type": "json_object"}
+
+
+@lru_cache(maxsize=32)
+def _get_shared_client(
+    model: str,
+    base_url: str,
+    api_version: str,
+    deployment: str,
+    api_key: str,
+    authentication_method: AuthenticationMethod,
+    client_id: Optional[str],
+    client_secret: Optional[str],
+    tenant_id: Optional[str],
+) -> Any:
+    """
+    Build (once per distinct configuration) the OpenAI client used by services.
+
+    Services are created per request by the FastAPI dependencies; sharing the
+    client lets them reuse one HTTP connection pool per Azure deployment.
+    """
+    return AzureClientFactory.create_openai_client_from_params(
+        model=model,
+        base_url=base_url,
+        api_version=api_version,
+        deployment=deployment,
+        api_key=api_key,
+        authentication_method=authentication_method,
+        client_id=client_id,
+        client_secret=client_secret,
+        tenant_id=tenant_id,
+    )
+
 
 class OpenAIService:
     def __init__(
@@ -52,8 +96,9 @@ class OpenAIService:
             self.client = client  # dependency injection for tests/advanced use
             return
 
-        # Centralized client creation (lazy imports, shared auth rules)
-        self.client = AzureClientFactory.create_openai_client_from_params(
+        # Centralized client creation (lazy imports, shared auth rules),
+        # reused across services with identical connection settings.
+        self.client = _get_shared_client(
             model=open_ai_model,
             base_url=azure_endpoint,
             api_version=api_version,
@@ -66,15 +111,68 @@ class OpenAIService:
             tenant_id=tenant_id or None,
         )
 
+    def _translate_bad_request(self, error: BadRequestError) -> NoReturn:
+        """
+        Re-raise a BadRequestError as the most specific typed error available.
+        """
+        message = error.message
+        body = getattr(error, "body", None)
+        if not isinstance(body, dict):
+            raise Exception(message)
+        message = body.get("message", message)
+
+        # Content filter path
+        if getattr(error, "code", None) == "content_filter" and "innererror" in body:
+            content_filter_results = body["innererror"].get("content_filter_result", {})
+            raise ContentFilterError(message, content_filter_results)
+
+        # Token limit (AOAI-style) pattern
+        token_error_match = TOKEN_ERROR_RE.match(message)
+        if token_error_match:
+            (
+                max_context_length,
+                requested_tokens,
+                prompt_tokens,
+                completion_tokens,
+            ) = token_error_match.groups()
+            raise TokenLimitExceededError(
+                message=message,
+                max_context_length=int(max_context_length),
+                requested_tokens=int(requested_tokens),
+                prompt_tokens=int(prompt_tokens),
+                completion_tokens=int(completion_tokens),
+            )
+
+        raise Exception(message)
+
+    def _log_prompt_cache_usage(self, response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is None:
+            return
+        logger.debug(
+            "OpenAI prompt cache usage",
+            model=self.model,
+            deployment=self._deployment,
+            cached_tokens=cached_tokens,
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+        )
+
     async def generate_response(
         self,
         messages: list[ChatCompletionMessageParam],
         tools: list[ChatCompletionToolParam] | None = None,
         tool_choice: ChatCompletionToolChoiceOptionParam | None = None,
         json_mode: bool = False,
+        stable_prefix: list[ChatCompletionMessageParam] | None = None,
     ) -> ChatCompletionMessage:
         """
         Generate a non-streaming response using Chat Completions.
+
+        `stable_prefix` (e.g. system prompt, few-shot examples) is always sent
+        ahead of `messages` so the prompt starts with identical bytes across
+        calls, which is what OpenAI's automatic prompt caching keys on.
         """
         logger.debug(
             "Generating OpenAI response",
@@ -94,10 +192,10 @@ class OpenAIService:
             response = self.client.chat.completions.create(
                 # For Azure, this MUST be the deployment name:
                 model=self._deployment,
-                messages=messages,
+                messages=stable_prefix + messages if stable_prefix else messages,
                 tools=tools or NOT_GIVEN,
                 tool_choice=effective_tool_choice,
-                response_format={"type": "json_object"} if json_mode else NOT_GIVEN,
+                response_format=_JSON_OBJECT_FMT if json_mode else NOT_GIVEN,
                 temperature=0.2,
             )
 
@@ -105,6 +203,7 @@ class OpenAIService:
                 raise RuntimeError(
                     "OpenAI chat.completions.create returned a response missing 'choices' or it was empty"
                 )
+            self._log_prompt_cache_usage(response)
             return response.choices[0].message
 
         except BadRequestError as error:
@@ -118,44 +217,7 @@ class OpenAIService:
                 exc_info=True,
             )
 
-            message = error.message
-            if isinstance(error.body, dict):
-                message = error.body.get("message", message)
-
-                # Content filter path
-                if (
-                    getattr(error, "code", None) == "content_filter"
-                    and "innererror" in error.body
-                ):
-                    content_filter_results = error.body["innererror"].get(
-                        "content_filter_result", {}
-                    )
-                    raise ContentFilterError(message, content_filter_results)
-
-                # Token limit (AOAI-style) pattern
-                token_error_pattern = (
-                    r"This model's maximum context length is (\d+) tokens, "
-                    r"however you requested (\d+) tokens \((\d+) in your prompt; "
-                    r"(\d+) for the completion\)\. Please reduce your prompt; or "
-                    r"completion length\."
-                )
-                token_error_match = re.match(token_error_pattern, message)
-                if token_error_match:
-                    (
-                        max_context_length,
-                        requested_tokens,
-                        prompt_tokens,
-                        completion_tokens,
-                    ) = token_error_match.groups()
-                    raise TokenLimitExceededError(
-                        message=message,
-                        max_context_length=int(max_context_length),
-                        requested_tokens=int(requested_tokens),
-                        prompt_tokens=int(prompt_tokens),
-                        completion_tokens=int(completion_tokens),
-                    )
-
-            raise Exception(message)
+            self._translate_bad_request(error)
 
         except Exception as e:
             logger.exception(e)
@@ -167,10 +229,13 @@ class OpenAIService:
         tools: list[ChatCompletionToolParam] | None = None,
         tool_choice: ChatCompletionToolChoiceOptionParam | None = None,
         json_mode: bool = False,
+        stable_prefix: list[ChatCompletionMessageParam] | None = None,
     ) -> AsyncIterator[str]:
         """
         Generate a streaming response using Chat Completions.
         Yields content chunks as they arrive.
+
+        `stable_prefix` is sent ahead of `messages`; see `generate_response`.
         """
         logger.debug(
             "Generating streaming OpenAI response",
@@ -189,10 +254,10 @@ class OpenAIService:
 
             stream = self.client.chat.completions.create(
                 model=self._deployment,  # Azure deployment name
-                messages=messages,
+                messages=stable_prefix + messages if stable_prefix else messages,
                 tools=tools or NOT_GIVEN,
                 tool_choice=effective_tool_choice,
-                response_format={"type": "json_object"} if json_mode else NOT_GIVEN,
+                response_format=_JSON_OBJECT_FMT if json_mode else NOT_GIVEN,
                 temperature=0.2,
                 stream=True,
             )
@@ -200,20 +265,22 @@ class OpenAIService:
             # Support both sync and async iterables to be future-proof
             if hasattr(stream, "__aiter__"):
                 async for chunk in stream:  # type: ignore[unreachable]
-                    if (
-                        getattr(chunk, "choices", None)
-                        and chunk.choices[0].delta
-                        and chunk.choices[0].delta.content
-                    ):
-                        yield chunk.choices[0].delta.content
+                    choices = getattr(chunk, "choices", None)
+                    if not choices:
+                        continue
+                    delta = choices[0].delta
+                    content = delta.content if delta else None
+                    if content:
+                        yield content
             else:
                 for chunk in stream:
-                    if (
-                        getattr(chunk, "choices", None)
-                        and chunk.choices[0].delta
-                        and chunk.choices[0].delta.content
-                    ):
-                        yield chunk.choices[0].delta.content
+                    choices = getattr(chunk, "choices", None)
+                    if not choices:
+                        continue
+                    delta = choices[0].delta
+                    content = delta.content if delta else None
+                    if content:
+                        yield content
 
         except BadRequestError as error:
             logger.error(
@@ -226,42 +293,7 @@ class OpenAIService:
                 exc_info=True,
             )
 
-            message = error.message
-            if isinstance(error.body, dict):
-                message = error.body.get("message", message)
-
-                if (
-                    getattr(error, "code", None) == "content_filter"
-                    and "innererror" in error.body
-                ):
-                    content_filter_results = error.body["innererror"].get(
-                        "content_filter_result", {}
-                    )
-                    raise ContentFilterError(message, content_filter_results)
-
-                token_error_pattern = (
-                    r"This model's maximum context length is (\d+) tokens, "
-                    r"however you requested (\d+) tokens \((\d+) in your prompt; "
-                    r"(\d+) for the completion\)\. Please reduce your prompt; or "
-                    r"completion length\."
-                )
-                token_error_match = re.match(token_error_pattern, message)
-                if token_error_match:
-                    (
-                        max_context_length,
-                        requested_tokens,
-                        prompt_tokens,
-                        completion_tokens,
-                    ) = token_error_match.groups()
-                    raise TokenLimitExceededError(
-                        message=message,
-                        max_context_length=int(max_context_length),
-                        requested_tokens=int(requested_tokens),
-                        prompt_tokens=int(prompt_tokens),
-                        completion_tokens=int(completion_tokens),
-                    )
-
-            raise Exception(message)
+            self._translate_bad_request(error)
 
         except Exception as e:
             logger.exception(e)
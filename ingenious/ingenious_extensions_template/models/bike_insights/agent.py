@@ -1,74 +1,37 @@
 from ingenious.models.agent import Agent, Agents, IProjectAgents
 from ingenious.models.config import Config
 
+# (agent_name, agent_display_name, agent_type, log_to_prompt_tuner, return_in_response)
+_AGENT_SPECS: tuple[tuple[str, str, str, bool, bool], ...] = (
+    ("customer_sentiment_agent", "Customer Sentiment", "researcher", True, False),
+    ("fiscal_analysis_agent", "Fiscal Analysis", "researcher", True, False),
+    ("summary", "Summarizer", "summary", True, True),
+    ("user_proxy", "user_proxy_agent", "user_proxy", False, False),
+    ("bike_lookup_agent", "bike_lookup_agent", "user_proxy", True, False),
+)
+
 
 class ProjectAgents(IProjectAgents):
     def Get_Project_Agents(self, config: Config) -> Agents:
-        local_agents = []
-        local_agents.append(
-            Agent(
-                agent_name="customer_sentiment_agent",
-                agent_model_name="gpt-4o-mini",
-                agent_display_name="Customer Sentiment",
-                agent_description="A sample agent.",
-                agent_type="researcher",
-                model=None,
-                system_prompt=None,
-                log_to_prompt_tuner=True,
-                return_in_response=False,
-            )
-        )
-        local_agents.append(
-            Agent(
-                agent_name="fiscal_analysis_agent",
-                agent_model_name="gpt-4o-mini",
-                agent_display_name="Fiscal Analysis",
-                agent_description="A sample agent.",
-                agent_type="researcher",
-                model=None,
-                system_prompt=None,
-                log_to_prompt_tuner=True,
-                return_in_response=False,
-            )
-        )
-        local_agents.append(
-            Agent(
-                agent_name="summary",
-                agent_model_name="gpt-4o-mini",
-                agent_display_name="Summarizer",
-                agent_description="A sample agent.",
-                agent_type="summary",
-                model=None,
-                system_prompt=None,
-                log_to_prompt_tuner=True,
-                return_in_response=True,
-            )
-        )
-        local_agents.append(
-            Agent(
-                agent_name="user_proxy",
-                agent_model_name="gpt-4o-mini",
-                agent_display_name="user_proxy_agent",
-                agent_description="A sample agent.",
-                agent_type="user_proxy",
-                model=None,
-                system_prompt=None,
-                log_to_prompt_tuner=False,
-                return_in_response=False,
-            )
-        )
-        local_agents.append(
+        local_agents = [
             Agent(
-                agent_name="bike_lookup_agent",
+                agent_name=name,
                 agent_model_name="gpt-4o-mini",
-                agent_display_name="bike_lookup_agent",
+                agent_display_name=display_name,
                 agent_description="A sample agent.",
-                agent_type="user_proxy",
+                agent_type=agent_type,
                 model=None,
                 system_prompt=None,
-                log_to_prompt_tuner=True,
-                return_in_response=False,
+                log_to_prompt_tuner=log_to_prompt_tuner,
+                return_in_response=return_in_response,
             )
-        )
+            for (
+                name,
+                display_name,
+                agent_type,
+                log_to_prompt_tuner,
+                return_in_response,
+            ) in _AGENT_SPECS
+        ]
 
         return Agents(agents=local_agents, config=config)
@@ -1,9 +1,12 @@
-import json
-from typing import List, Union
+from typing import Any, List, Union
 
 from pydantic import BaseModel, Field
 
-from ingenious.utils.model_utils import Listable_Object_To_Csv
+from ingenious.utils.model_utils import (
+    Get_Model_Properties,
+    Is_Non_Complex_Field_Check_By_Type,
+    List_To_Csv,
+)
 
 
 class RootModel_Bike(BaseModel):
@@ -54,6 +57,14 @@ class RootModel_BikeSale_Extended(RootModel_BikeSale):
     location: str
 
 
+# Column order of RootModel_BikeSale_Extended, minus nested models.
+_BIKE_SALE_TABLE_HEADERS: list[str] = [
+    prop.FieldName
+    for prop in Get_Model_Properties(RootModel_BikeSale_Extended)
+    if Is_Non_Complex_Field_Check_By_Type(prop.FieldType)
+]
+
+
 class RootModel_Store(BaseModel):
     name: str
     location: str
@@ -66,22 +77,18 @@ class RootModel(BaseModel):
 
     @staticmethod
     def load_from_json(json_data: str) -> None:
-        data = json.loads(json_data)
-        root_model = RootModel(**data)
+        root_model = RootModel.model_validate_json(json_data)
         print(root_model)
 
     def display_bike_sales_as_table(self) -> str:
-        table_data: list[RootModel_BikeSale_Extended] = []
-
-        for store in self.stores:
-            for sale in store.bike_sales:
-                store_name = store.name
-                location = store.location
-                rec = RootModel_BikeSale_Extended(
-                    store_name=store_name, location=location, **sale.model_dump()
-                )
-                table_data.append(rec)
-
-        ret = Listable_Object_To_Csv(table_data, RootModel_BikeSale_Extended)
+        # Rows are plain dicts: the sales are already validated, so building a
+        # RootModel_BikeSale_Extended per row would only repeat that work.
+        table_data: list[dict[str, Any]] = [
+            dict(sale.__dict__, store_name=store.name, location=store.location)
+            for store in self.stores
+            for sale in store.bike_sales
+        ]
+
+        ret = List_To_Csv(table_data, _BIKE_SALE_TABLE_HEADERS, "Sales")
         # Note always provide tabular data with a heading as this allows our datatables extension to render the data correctly
         return "## Sales\n" + ret
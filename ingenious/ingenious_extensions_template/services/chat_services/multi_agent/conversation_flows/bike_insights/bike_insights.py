@@ -4,7 +4,6 @@ import logging
 import random
 from typing import Annotated, List
 
-import jsonpickle
 from autogen_core import (
     EVENT_LOGGER_NAME,
     SingleThreadedAgentRuntime,
@@ -12,6 +11,7 @@ from autogen_core import (
     TypeSubscription,
 )
 from autogen_core.tools import FunctionTool
+from pydantic import TypeAdapter
 
 # Custom class import from ingenious_extensions
 from ingenious.ingenious_extensions_template.models.bike_insights.agent import (
@@ -32,6 +32,9 @@ from ingenious.models.chat import ChatRequest, ChatResponse
 from ingenious.models.message import Message as ChatHistoryMessage
 from ingenious.services.chat_services.multi_agent.service import IConversationFlow
 
+# Serializer for the logged agent chats returned as ChatResponse.agent_response.
+_AGENT_CHATS = TypeAdapter(list[AgentChat])
+
 
 class ConversationFlow(IConversationFlow):
     async def get_conversation_response(
@@ -99,11 +102,19 @@ class ConversationFlow(IConversationFlow):
 
         # Now add your system prompts to your agents from the prompt templates
         # Modify this if you want to modify the pattern used to correlate the agent name to the prompt template
-        for agent in agents.get_agents():
-            template_name = f"{agent.agent_name}_prompt.jinja"
-            agent.system_prompt = await self.Get_Template(
-                file_name=template_name, revision_id=revision_id
+        # Templates are independent reads, so fetch them concurrently.
+        agent_list = agents.get_agents()
+        system_prompts = await asyncio.gather(
+            *(
+                self.Get_Template(
+                    file_name=f"{agent.agent_name}_prompt.jinja",
+                    revision_id=revision_id,
+                )
+                for agent in agent_list
             )
+        )
+        for agent, system_prompt in zip(agent_list, system_prompts):
+            agent.system_prompt = system_prompt
 
         # Now construct your autogen conversation pattern the way you want
         # In this sample I'll first define my topic agents
@@ -200,20 +211,24 @@ class ConversationFlow(IConversationFlow):
 
         runtime.start()
 
-        initial_message: AgentMessage = AgentMessage(content=json.dumps(message))
-        initial_message.content = "```json\n" + initial_message.content + "\n```"
+        # user_prompt is the JSON already parsed above; fence it as-is rather
+        # than re-encoding the parsed payload.
+        initial_message: AgentMessage = AgentMessage(
+            content="```json\n" + chat_request.user_prompt + "\n```"
+        )
         fiscal_analysis_agent_message: AgentMessage = AgentMessage(
             content=bike_sales_data.display_bike_sales_as_table()
         )
-        await asyncio.gather(
-            runtime.publish_message(
-                initial_message,
-                topic_id=TopicId(type="customer_sentiment_agent", source="default"),
-            ),
-            runtime.publish_message(
-                fiscal_analysis_agent_message,
-                topic_id=TopicId(type="fiscal_analysis_agent", source="default"),
-            ),
+        # SingleThreadedAgentRuntime.publish_message only enqueues, so awaiting
+        # in turn costs nothing; use asyncio.gather if the runtime is swapped
+        # for one whose publish does network I/O.
+        await runtime.publish_message(
+            initial_message,
+            topic_id=TopicId(type="customer_sentiment_agent", source="default"),
+        )
+        await runtime.publish_message(
+            fiscal_analysis_agent_message,
+            topic_id=TopicId(type="fiscal_analysis_agent", source="default"),
         )
 
         await runtime.stop_when_idle()
@@ -227,17 +242,16 @@ class ConversationFlow(IConversationFlow):
         chat_response = ChatResponse(
             thread_id=chat_request.thread_id,
             message_id=identifier,
-            agent_response=jsonpickle.encode(
-                unpicklable=False, value=llm_logger._queue
-            ),
+            # serialize_as_any keeps the fields of concrete chat message types.
+            agent_response=_AGENT_CHATS.dump_json(
+                llm_logger._queue, serialize_as_any=True
+            ).decode(),
             token_count=llm_logger.prompt_tokens,
             max_token_count=0,
             memory_summary="",
         )
 
-        summary_response: AgentChat = next(
-            chat for chat in llm_logger._queue if chat.chat_name == "summary"
-        )
+        summary_response: AgentChat = llm_logger.get_chat_by_name("summary")
 
         message: ChatHistoryMessage = ChatHistoryMessage(
             user_id=chat_request.user_id,
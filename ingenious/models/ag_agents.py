@@ -1,8 +1,8 @@
 import asyncio
+import weakref
 from abc import ABC
-from typing import List
+from typing import TYPE_CHECKING, Any, List, Sequence
 
-from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import TextMessage
 from autogen_core import MessageContext, RoutedAgent, TopicId, message_handler
@@ -13,38 +13,90 @@ from autogen_core.models import (
     SystemMessage,
     UserMessage,
 )
+from autogen_core.tools import Tool
 
 from ingenious.client.azure import AzureClientFactory
+from ingenious.config.auth_config import AzureAuthConfig
 from ingenious.models.agent import (
     Agent,
     AgentChat,
     AgentMessage,
 )
 
+if TYPE_CHECKING:
+    from autogen_agentchat.agents import AssistantAgent
+
+# Chat clients shared by agents on the same event loop, keyed by connection
+# settings. Scoped per loop because the underlying HTTP pool is loop-bound.
+_CHAT_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[Any, ...], Any]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_chat_client(model_config: Any) -> Any:
+    """
+    Return a chat completion client for `model_config`, reusing one already
+    built on the running loop for the same deployment and credentials.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AzureClientFactory.create_openai_chat_completion_client(model_config)
+
+    key = (
+        AzureAuthConfig.from_config(model_config).auth_key(),
+        getattr(model_config, "model", None),
+        getattr(model_config, "deployment", None),
+    )
+    clients = _CHAT_CLIENTS.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None:
+        client = AzureClientFactory.create_openai_chat_completion_client(model_config)
+        clients[key] = client
+    return client
+
 
 class RoutedAssistantAgent(RoutedAgent, ABC):
+    # Upper bound on tool calls executed concurrently for one model response.
+    _max_concurrent_tool_calls: int = 8
+
     def __init__(
-        self, agent: Agent, data_identifier: str, next_agent_topic: str = None, tools=[]
+        self,
+        agent: Agent,
+        data_identifier: str,
+        next_agent_topic: str | None = None,
+        tools: Sequence[Tool] = (),
     ) -> None:
         super().__init__(agent.agent_name)
 
-        # Create the Azure OpenAI client using the provided model configuration
-        self._model_client = AzureClientFactory.create_openai_chat_completion_client(
-            agent.model
-        )
+        # Azure OpenAI client for the model configuration, shared with other
+        # agents on this loop that target the same deployment
+        self._model_client = _get_chat_client(agent.model)
 
-        assistant_agent = AssistantAgent(
-            name=agent.agent_name,
-            system_message=agent.system_prompt,
-            description="I am an AI assistant that helps with research.",
-            model_client=self._model_client,
-        )
-        self._delegate = assistant_agent
+        # The handler calls the model client directly; the AssistantAgent
+        # delegate is only built if a subclass asks for it.
+        self._delegate_agent: "AssistantAgent | None" = None
         self._agent: Agent = agent
         self._data_identifier = data_identifier
         self._next_agent_topic = next_agent_topic
-        self._tools = tools
+        # Frozen so the tool schemas sent with every request stay identical.
+        self._tools = tuple(tools)
         self._system_messages = [SystemMessage(content=agent.system_prompt)]
+        # Immutable session prefix copied into each handler call.
+        self._system_prefix: tuple[LLMMessage, ...] = tuple(self._system_messages)
+
+    @property
+    def _delegate(self) -> "AssistantAgent":
+        if self._delegate_agent is None:
+            from autogen_agentchat.agents import AssistantAgent
+
+            self._delegate_agent = AssistantAgent(
+                name=self._agent.agent_name,
+                system_message=self._agent.system_prompt,
+                description="I am an AI assistant that helps with research.",
+                model_client=self._model_client,
+            )
+        return self._delegate_agent
 
     @message_handler
     async def handle_my_message_type(
@@ -66,10 +118,8 @@ class RoutedAssistantAgent(RoutedAgent, ABC):
         #     await self.publish_my_message(agent_chat)
 
         # Create a session of messages.
-        session: List[LLMMessage] = self._system_messages + [
-            UserMessage(content=message.content, source="user")
-        ]
-        execute_tool_calls = True
+        session: List[LLMMessage] = list(self._system_prefix)
+        session.append(UserMessage(content=message.content, source="user"))
 
         # Run the chat completion with the tools.
         create_result = await self._model_client.create(
@@ -83,38 +133,42 @@ class RoutedAssistantAgent(RoutedAgent, ABC):
             agent_chat.chat_response = Response(
                 chat_message=TextMessage(content=create_result.content, source="user")
             )
-            execute_tool_calls = False
+            if self._next_agent_topic:
+                await self.publish_my_message(agent_chat)
+            return
 
-        if execute_tool_calls:
-            # Add the first model create result to the session.
-            session.append(
-                AssistantMessage(content=create_result.content, source="assistant")
-            )
+        # Add the first model create result to the session.
+        session.append(
+            AssistantMessage(content=create_result.content, source="assistant")
+        )
 
-            # Execute the tool calls.
-            results = await asyncio.gather(
-                *[
-                    self._agent.execute_tool_call(
-                        call, ctx.cancellation_token, tools=self._tools
-                    )
-                    for call in create_result.content
-                ]
-            )
+        # Execute the tool calls, capping how many run at once.
+        tool_slots = asyncio.Semaphore(self._max_concurrent_tool_calls)
 
-            # Add the function execution results to the session.
-            session.append(FunctionExecutionResultMessage(content=results))
+        async def _run_tool_call(call: Any) -> Any:
+            async with tool_slots:
+                return await self._agent.execute_tool_call(
+                    call, ctx.cancellation_token, tools=self._tools
+                )
 
-            # Run the chat completion again to reflect on the history and function execution results.
-            create_result = await self._model_client.create(
-                messages=session,
-                cancellation_token=ctx.cancellation_token,
-            )
-            assert isinstance(create_result.content, str)
+        results = await asyncio.gather(
+            *[_run_tool_call(call) for call in create_result.content]
+        )
 
-            # Return the result as a message.
-            agent_chat.chat_response = Response(
-                chat_message=TextMessage(content=create_result.content, source="user")
-            )
+        # Add the function execution results to the session.
+        session.append(FunctionExecutionResultMessage(content=results))
+
+        # Run the chat completion again to reflect on the history and function execution results.
+        create_result = await self._model_client.create(
+            messages=session,
+            cancellation_token=ctx.cancellation_token,
+        )
+        assert isinstance(create_result.content, str)
+
+        # Return the result as a message.
+        agent_chat.chat_response = Response(
+            chat_message=TextMessage(content=create_result.content, source="user")
+        )
 
         if self._next_agent_topic:
             await self.publish_my_message(agent_chat)
@@ -182,6 +236,9 @@ class RoutedResponseOutputAgent(RoutedAgent, ABC):
         super().__init__(agent.agent_name)
         self._next_agent_topic = next_agent_topic
 
+        # Deferred so importing this module does not load the agentchat agents.
+        from autogen_agentchat.agents import AssistantAgent
+
         model_client = AzureClientFactory.create_openai_chat_completion_client(
             agent.model
         )
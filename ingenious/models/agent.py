@@ -3,7 +3,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import TextMessage
@@ -290,6 +290,8 @@ class LLMUsageTracker(logging.Handler):
         self._agents = agents
         self._completion_tokens = 0
         self._queue: List[AgentChat] = []
+        # First queued chat per chat_name, maintained alongside _queue.
+        self._chats_by_name: Dict[str, AgentChat] = {}
         self._config = config
         self._chat_history_database: ChatHistoryRepository = chat_history_repository
         self._revision_id: str = revision_id
@@ -308,6 +310,12 @@ class LLMUsageTracker(logging.Handler):
     def completion_tokens(self) -> int:
         return self._completion_tokens
 
+    def get_chat_by_name(self, chat_name: str) -> AgentChat:
+        try:
+            return self._chats_by_name[chat_name]
+        except KeyError:
+            raise ValueError(f"AgentChat with name {chat_name} not found") from None
+
     def reset(self) -> None:
         self._prompt_tokens = 0
         self._completion_tokens = 0
@@ -459,6 +467,7 @@ class LLMUsageTracker(logging.Handler):
         chat.end_time = datetime.now().timestamp()
         if add_chat:
             self._queue.append(chat)
+            self._chats_by_name.setdefault(chat.chat_name, chat)
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit the log record."""
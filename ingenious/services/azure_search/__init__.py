@@ -1,22 +1,29 @@
 # ingenious/services/azure_search/__init__.py
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ingenious.services.retrieval.errors import GenerationDisabledError  # noqa: F401
 
 # Export the light model directly – safe to import anytime
 from .config import SearchConfig  # noqa: F401
 
+# Resolved on the first build_search_pipeline() call.
+_build_search_pipeline_impl: Optional[Callable[..., "AdvancedSearchPipeline"]] = None
+
 
 # Add type hints to the function signature
 def build_search_pipeline(*args: Any, **kwargs: Any) -> "AdvancedSearchPipeline":
     """
     Lazy proxy so importing this package does NOT pull Azure SDKs.
-    The real import happens only when the function is actually called.
+    The real import happens only when the function is first called.
     """
-    from .components.pipeline import build_search_pipeline as _impl
+    global _build_search_pipeline_impl
+    impl = _build_search_pipeline_impl
+    if impl is None:
+        from .components.pipeline import build_search_pipeline as _impl
 
-    return _impl(*args, **kwargs)
+        impl = _build_search_pipeline_impl = _impl
+    return impl(*args, **kwargs)
 
 
 if TYPE_CHECKING:
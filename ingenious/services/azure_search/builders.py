@@ -14,9 +14,11 @@ The main entry point is `build_search_config_from_settings`.
 from __future__ import annotations
 
 import logging
+import threading
 import urllib.parse
+import weakref
 from types import SimpleNamespace
-from typing import Any, Optional, Protocol, cast, runtime_checkable
+from typing import Any, Optional, Protocol, cast
 
 from pydantic import SecretStr
 
@@ -26,10 +28,6 @@ from ingenious.services.azure_search import SearchConfig
 log = logging.getLogger("ingenious.services.azure_search.builders")
 
 # Constants
-EMBEDDING_ROLES = frozenset(["embedding"])
-EMBEDDING_NAME_PATTERNS = frozenset(["embedding", "embed"])
-CHAT_ROLES = frozenset(["chat", "completion", "generation"])
-CHAT_NAME_PATTERNS = frozenset(["gpt", "4o"])
 DEFAULT_API_VERSION = "2024-02-15-preview"
 DEFAULT_SEMANTIC_CONFIG = "default"
 DEFAULT_TOP_K_RETRIEVAL = 20
@@ -37,6 +35,38 @@ DEFAULT_TOP_N_FINAL = 5
 DEFAULT_ID_FIELD = "id"
 DEFAULT_CONTENT_FIELD = "content"
 DEFAULT_VECTOR_FIELD = "vector"
+_HTTP_SCHEMES = frozenset(["http", "https"])
+
+# Raw inputs read by the builder; compared to detect changed settings.
+_SEARCH_INPUT_FIELDS = (
+    "endpoint",
+    "key",
+    "api_key",
+    "index_name",
+    "use_semantic_ranking",
+    "semantic_ranking",
+    "semantic_configuration",
+    "semantic_configuration_name",
+    "top_k_retrieval",
+    "top_n_final",
+    "id_field",
+    "content_field",
+    "vector_field",
+)
+_MODEL_INPUT_FIELDS = (
+    "role",
+    "model",
+    "deployment",
+    "endpoint",
+    "base_url",
+    "key",
+    "api_key",
+    "api_version",
+)
+
+# Last (settings weakref, input fingerprint, SearchConfig) built.
+_LAST_BUILD: Optional[tuple[weakref.ref[Any], tuple[Any, ...], SearchConfig]] = None
+_LAST_BUILD_LOCK = threading.Lock()
 
 
 class ConfigError(ValueError):
@@ -45,7 +75,6 @@ class ConfigError(ValueError):
     pass
 
 
-@runtime_checkable
 class ModelConfig(Protocol):
     """Type protocol for model configuration objects.
 
@@ -64,7 +93,6 @@ class ModelConfig(Protocol):
     api_version: Optional[str]
 
 
-@runtime_checkable
 class AzureSearchService(Protocol):
     """Type protocol for Azure Search service configuration.
 
@@ -111,11 +139,33 @@ def _validate_endpoint(endpoint: str, name: str) -> str:
     if not endpoint:
         raise ConfigError(f"{name} cannot be empty")
 
+    # Fast path for well-formed endpoints: an http(s) prefix followed by a
+    # non-empty host. Anything urlparse treats specially (brackets for IPv6
+    # hosts, non-ASCII netlocs, stripped control characters) takes the full
+    # parse below so the accept/reject decision stays the same.
+    head = endpoint[:8].lower()
+    if head.startswith("https://"):
+        host_start = 8
+    elif head.startswith("http://"):
+        host_start = 7
+    else:
+        host_start = 0
+    if (
+        host_start
+        and len(endpoint) > host_start
+        and endpoint[host_start] not in "/?#"
+        and endpoint.isascii()
+        and endpoint.isprintable()
+        and "[" not in endpoint
+        and "]" not in endpoint
+    ):
+        return endpoint
+
     try:
         result = urllib.parse.urlparse(endpoint)
-        if not all([result.scheme, result.netloc]):
+        if not (result.scheme and result.netloc):
             raise ConfigError(f"{name} must be a valid URL with scheme and host")
-        if result.scheme not in ["http", "https"]:
+        if result.scheme not in _HTTP_SCHEMES:
             raise ConfigError(f"{name} must use http or https scheme")
     except Exception as e:
         raise ConfigError(f"Invalid {name}: {e}")
@@ -131,23 +181,27 @@ def _first_non_empty(*vals: Optional[str]) -> Optional[str]:
     first one that is validly provided.
     """
     for v in vals:
-        if isinstance(v, str) and v.strip():
-            return v.strip()
+        # Each value is stripped only once.
+        if isinstance(v, str):
+            s = v.strip()
+            if s:
+                return s
     return None
 
 
-def _get(obj: Any, *names: str) -> Optional[Any]:
-    """Return the first existing attribute value by name from an object.
+def _get(obj: Any, name: str, alias: Optional[str] = None) -> Optional[Any]:
+    """Return an attribute value by name, falling back to an alias.
 
-    This function provides a safe way to access an attribute using multiple
-    possible names (aliases), returning the first one found. This is useful for
+    This function provides a safe way to access an attribute that may be
+    spelled two ways, returning the first one that is set. This is useful for
     making configuration more flexible (e.g., accepting `key` or `api_key`).
+    Every caller needs at most one alias, so both names are taken explicitly
+    rather than packed into a varargs tuple and looped over.
     """
-    for n in names:
-        val: Optional[Any] = getattr(obj, n, None)
-        if val is not None:
-            return val
-    return None
+    val: Optional[Any] = getattr(obj, name, None)
+    if val is None and alias is not None:
+        val = getattr(obj, alias, None)
+    return val
 
 
 def _ensure_nonempty(value: Optional[str], field_name: str) -> str:
@@ -162,36 +216,47 @@ def _ensure_nonempty(value: Optional[str], field_name: str) -> str:
     return s
 
 
-def _extract_secret_value(value: Optional[str | SecretStr]) -> Optional[str]:
+def _extract_secret_value(value: Optional[Any]) -> Optional[str]:
     """Extract the string value from a SecretStr or return a string directly.
 
     This function centralizes the logic for handling values that might be
     wrapped in Pydantic's `SecretStr` for security. It safely unwraps the
-    secret or returns the original value if it's already a string.
+    secret or returns the original value if it's already a string. Other
+    objects exposing `get_secret_value` (duck-typed settings) are unwrapped
+    as well.
     """
     if value is None:
         return None
     if isinstance(value, str):
         return value
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
     if hasattr(value, "get_secret_value"):
         try:
-            return value.get_secret_value()
+            return cast(Optional[str], value.get_secret_value())
         except (AttributeError, TypeError) as e:
-            log.debug(f"Failed to extract secret value: {e}")
+            log.debug("Failed to extract secret value: %s", e)
     return None
 
 
 # -------------------- Model configuration helpers --------------------
-def _model_endpoint(model: ModelConfig) -> Optional[str]:
-    """Get the model endpoint, trying both `endpoint` and `base_url` attributes.
+def _pick_endpoint(*models: ModelConfig) -> str:
+    """Return the first validated endpoint among `models`, in priority order.
+
+    Each model is checked for both `endpoint` and `base_url`, since different
+    libraries and conventions use different attribute names for the same
+    concept (an API base URL). Lookup, emptiness check and URL validation
+    happen in one pass.
 
-    This exists to provide user flexibility, as different libraries and
-    conventions use different attribute names for the same concept (an API base
-    URL).
+    Raises:
+        ConfigError: If no model provides an endpoint or it is not a valid URL.
     """
-    return _first_non_empty(
-        getattr(model, "endpoint", None), getattr(model, "base_url", None)
-    )
+    for model in models:
+        for attr in ("endpoint", "base_url"):
+            value = getattr(model, attr, None)
+            if isinstance(value, str) and value.strip():
+                return _validate_endpoint(value, "OpenAI endpoint")
+    raise ConfigError("OpenAI endpoint is required and was not provided.")
 
 
 def _model_key(model: ModelConfig) -> Optional[str]:
@@ -205,32 +270,26 @@ def _model_key(model: ModelConfig) -> Optional[str]:
     return _extract_secret_value(key)
 
 
-def _is_embedding_model(model: ModelConfig) -> bool:
-    """Determine if a model is intended for embedding.
-
-    This function identifies an embedding model by checking its assigned 'role'
-    or by looking for common embedding-related patterns in its name. This is
-    critical for selecting the correct deployment for embedding tasks.
-    """
-    role: str = (getattr(model, "role", "") or "").lower()
-    if role in EMBEDDING_ROLES:
-        return True
-    name: str = (getattr(model, "model", "") or "").lower()
-    return any(pattern in name for pattern in EMBEDDING_NAME_PATTERNS)
+def _classify_model(model: ModelConfig) -> tuple[bool, bool]:
+    """Determine whether a model can serve embedding and/or chat requests.
 
+    A model is classified by its assigned 'role' or, failing that, by common
+    patterns in its name ('embedding'/'embed' for embeddings, 'gpt'/'4o' for
+    chat). Role and name are read and lower-cased once for both checks, which
+    is critical for selecting the correct deployment for each task.
 
-def _is_chat_model(model: ModelConfig) -> bool:
-    """Determine if a model is intended for chat/completion.
-
-    This function identifies a chat/generation model by checking its 'role'
-    or by looking for common patterns in its name (e.g., 'gpt', '4o'). This is
-    critical for selecting the correct deployment for generation tasks.
+    Returns:
+        A tuple of (is_embedding, is_chat).
     """
     role: str = (getattr(model, "role", "") or "").lower()
-    if role in CHAT_ROLES:
-        return True
     name: str = (getattr(model, "model", "") or "").lower()
-    return any(pattern in name for pattern in CHAT_NAME_PATTERNS)
+    # The role and pattern sets are tiny, so literal comparisons beat set
+    # lookups and any() generators. "embed" also covers "embedding".
+    is_embedding = role == "embedding" or "embed" in name
+    is_chat = (
+        role in ("chat", "completion", "generation") or "gpt" in name or "4o" in name
+    )
+    return is_embedding, is_chat
 
 
 # -------------------- Model selection --------------------
@@ -251,12 +310,17 @@ def _select_models(models: list[ModelConfig]) -> tuple[ModelConfig, ModelConfig]
         ConfigError: If the models cannot be properly identified or if one of
             the required roles is missing from the configuration.
     """
-    emb_cfg: Optional[ModelConfig] = next(
-        (m for m in models if _is_embedding_model(m)), None
-    )
-    chat_cfg: Optional[ModelConfig] = next(
-        (m for m in models if _is_chat_model(m)), None
-    )
+    # Single pass: take the first model matching each role.
+    emb_cfg: Optional[ModelConfig] = None
+    chat_cfg: Optional[ModelConfig] = None
+    for m in models:
+        is_embedding, is_chat = _classify_model(m)
+        if emb_cfg is None and is_embedding:
+            emb_cfg = m
+        if chat_cfg is None and is_chat:
+            chat_cfg = m
+        if emb_cfg is not None and chat_cfg is not None:
+            break
 
     if emb_cfg and chat_cfg:
         return emb_cfg, chat_cfg
@@ -322,11 +386,7 @@ def _pick_models(settings: IngeniousSettings) -> tuple[str, str, str, str, str]:
     )
 
     # Extract and validate endpoint
-    endpoint_candidate = _first_non_empty(
-        _model_endpoint(chat_cfg), _model_endpoint(emb_cfg)
-    )
-    endpoint = _ensure_nonempty(endpoint_candidate, "OpenAI endpoint")
-    endpoint = _validate_endpoint(endpoint, "OpenAI endpoint")
+    endpoint = _pick_endpoint(chat_cfg, emb_cfg)
 
     # Extract API key
     key_candidate = _first_non_empty(_model_key(chat_cfg), _model_key(emb_cfg))
@@ -381,26 +441,44 @@ def _extract_search_config(svc: AzureSearchService) -> dict[str, Any]:
     semantic_configuration_name = cast(str, semantic_configuration_name_candidate)
 
     # Extract optional parameters with defaults and validate
-    top_k_retrieval: int = getattr(svc, "top_k_retrieval", DEFAULT_TOP_K_RETRIEVAL)
-    top_n_final: int = getattr(svc, "top_n_final", DEFAULT_TOP_N_FINAL)
+    top_k_retrieval: Any = getattr(svc, "top_k_retrieval", DEFAULT_TOP_K_RETRIEVAL)
+    top_n_final: Any = getattr(svc, "top_n_final", DEFAULT_TOP_N_FINAL)
 
-    # Validate that top_k and top_n are positive
+    # Validate that top_k and top_n are positive integers
+    if not isinstance(top_k_retrieval, int):
+        raise ConfigError(
+            f"top_k_retrieval must be an integer, got {type(top_k_retrieval).__name__}"
+        )
+    if not isinstance(top_n_final, int):
+        raise ConfigError(
+            f"top_n_final must be an integer, got {type(top_n_final).__name__}"
+        )
     if top_k_retrieval <= 0:
         raise ConfigError(f"top_k_retrieval must be positive, got {top_k_retrieval}")
     if top_n_final <= 0:
         raise ConfigError(f"top_n_final must be positive, got {top_n_final}")
 
+    # Index field mappings are passed to SearchConfig unvalidated, so check
+    # their types here.
+    field_names: dict[str, Any] = {
+        "id_field": getattr(svc, "id_field", DEFAULT_ID_FIELD),
+        "content_field": getattr(svc, "content_field", DEFAULT_CONTENT_FIELD),
+        "vector_field": getattr(svc, "vector_field", DEFAULT_VECTOR_FIELD),
+    }
+    for field, value in field_names.items():
+        if not isinstance(value, str):
+            raise ConfigError(f"{field} must be a string, got {type(value).__name__}")
+
     return {
         "search_endpoint": search_endpoint,
         "search_key": SecretStr(search_key),
         "search_index_name": index_name,
         "use_semantic_ranking": bool(use_semantic_ranking),
         "semantic_configuration_name": semantic_configuration_name,
-        "top_k_retrieval": top_k_retrieval,
-        "top_n_final": top_n_final,
-        "id_field": getattr(svc, "id_field", DEFAULT_ID_FIELD),
-        "content_field": getattr(svc, "content_field", DEFAULT_CONTENT_FIELD),
-        "vector_field": getattr(svc, "vector_field", DEFAULT_VECTOR_FIELD),
+        # int() turns a bool into 1/0, as SearchConfig's lax validation did.
+        "top_k_retrieval": int(top_k_retrieval),
+        "top_n_final": int(top_n_final),
+        **field_names,
     }
 
 
@@ -450,6 +528,51 @@ def _ensure_openai_property_on_config_class() -> None:
         )
 
 
+# Patch once at import so builds do not repeat the check for cfg.openai.
+_ensure_openai_property_on_config_class()
+
+
+# -------------------- Build memoization --------------------
+def _settings_fingerprint(settings: IngeniousSettings) -> tuple[Any, ...]:
+    """Snapshot the raw settings values that feed the builder.
+
+    Settings objects are mutable, so a cached config is only reused while this
+    snapshot still compares equal.
+    """
+    services = getattr(settings, "azure_search_services", None) or []
+    svc = services[0] if services else None
+    models = getattr(settings, "models", None) or []
+    return (
+        tuple(getattr(svc, f, None) for f in _SEARCH_INPUT_FIELDS),
+        tuple(tuple(getattr(m, f, None) for f in _MODEL_INPUT_FIELDS) for m in models),
+    )
+
+
+def _cached_build(
+    settings: IngeniousSettings, fingerprint: tuple[Any, ...]
+) -> Optional[SearchConfig]:
+    """Return the last built config if it came from these exact settings."""
+    last = _LAST_BUILD
+    if last is None:
+        return None
+    ref, last_fingerprint, cfg = last
+    if ref() is not settings or last_fingerprint != fingerprint:
+        return None
+    return cfg
+
+
+def _remember_build(
+    settings: IngeniousSettings, fingerprint: tuple[Any, ...], cfg: SearchConfig
+) -> None:
+    global _LAST_BUILD
+    try:
+        ref = weakref.ref(settings)
+    except TypeError:
+        return
+    with _LAST_BUILD_LOCK:
+        _LAST_BUILD = (ref, fingerprint, cfg)
+
+
 # -------------------- Main builder function --------------------
 
 
@@ -473,6 +596,13 @@ def build_search_config_from_settings(settings: IngeniousSettings) -> SearchConf
         ConfigError: If the configuration is invalid, incomplete, or violates
             a key constraint (like using the same deployment for two roles).
     """
+    # SearchConfig is frozen, so the last one built from unchanged settings can
+    # be handed out again (the common case for per-request providers).
+    fingerprint = _settings_fingerprint(settings)
+    cached = _cached_build(settings, fingerprint)
+    if cached is not None:
+        return cached
+
     # Validate Azure Search services configuration
     services: list[AzureSearchService] = (
         getattr(settings, "azure_search_services", None) or []
@@ -497,11 +627,11 @@ def build_search_config_from_settings(settings: IngeniousSettings) -> SearchConf
             "distinct Azure OpenAI deployments for embeddings and chat."
         )
 
-    # Ensure backward compatibility for consumers expecting cfg.openai
-    _ensure_openai_property_on_config_class()
-
-    # Build final configuration
-    return SearchConfig(
+    # Build final configuration. _extract_search_config and _pick_models have
+    # already checked the type of every field (endpoints, keys, names, top_k/
+    # top_n and index field mappings), and SearchConfig declares no validators
+    # of its own, so skip re-validation.
+    cfg = SearchConfig.model_construct(
         # Azure Search settings
         **search_config,
         # OpenAI / Azure OpenAI settings
@@ -511,3 +641,5 @@ def build_search_config_from_settings(settings: IngeniousSettings) -> SearchConf
         embedding_deployment_name=emb_dep,
         generation_deployment_name=gen_dep,
     )
+    _remember_build(settings, fingerprint, cfg)
+    return cfg
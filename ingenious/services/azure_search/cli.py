@@ -11,15 +11,18 @@ command and the lazy-loaded `build_search_pipeline` shim used by tests.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any, Callable
+import sys
+from typing import Any, Callable, cast
 
 import click
 import typer
 from pydantic import SecretStr, ValidationError
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.text import Text
 from typer.core import TyperGroup
 
 # ── Local imports ────────────────────────────────────────────────────────────
@@ -35,22 +38,23 @@ CONTENT_SAMPLE_PREVIEW_LEN = 250
 DEFAULT_OPENAI_API_VERSION = "2024-02-01"
 DEFAULT_LOGGING_LEVEL = logging.WARNING
 
-# ── Lazy loader for the heavy pipeline ───────────────────────────────────────
-_build_pipeline_impl: Callable[..., Any] | None = None
+# Result titles parsed once; Panel copies its title before rendering.
+ANSWER_PANEL_TITLE = Text.from_markup("[bold green]:robot: Answer[/bold green]")
+ERROR_PANEL_TITLE = Text.from_markup("[bold red]Error[/bold red]")
 
 
+# ── Lazy loader for the heavy pipeline ───────────────────────────────────────
+@functools.cache
 def _get_build_pipeline_impl() -> Callable[..., Any]:
     """Import and return the pipeline factory lazily.
 
     Avoids importing heavy ML deps (e.g., torch/transformers) when users only
     need help/usage. This keeps the CLI snappy for `--help` and similar flows.
+    The result is cached after the first call.
     """
-    global _build_pipeline_impl
-    if _build_pipeline_impl is None:
-        from .components.pipeline import build_search_pipeline as _impl
+    from .components.pipeline import build_search_pipeline as _impl
 
-        _build_pipeline_impl = _impl
-    return _build_pipeline_impl
+    return _impl
 
 
 def build_search_pipeline(*args: Any, **kwargs: Any) -> Any:
@@ -127,6 +131,15 @@ console = Console()
 # Configure basic logging (overridden by `setup_logging`)
 logging.basicConfig(level=DEFAULT_LOGGING_LEVEL)
 
+# Loggers whose level follows --verbose.
+_SEARCH_LOGGERS = (
+    "ingenious.services.azure_search.pipeline",
+    "ingenious.services.azure_search.components.retrieval",
+    "ingenious.services.azure_search.components.fusion",
+    "ingenious.services.azure_search.components.generation",
+    __name__,  # Include CLI logger itself
+)
+
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging levels for application components.
@@ -139,25 +152,31 @@ def setup_logging(verbose: bool) -> None:
     """
     level = logging.DEBUG if verbose else logging.INFO
 
-    loggers = [
-        "ingenious.services.azure_search.pipeline",
-        "ingenious.services.azure_search.components.retrieval",
-        "ingenious.services.azure_search.components.fusion",
-        "ingenious.services.azure_search.components.generation",
-        __name__,  # Include CLI logger itself
-    ]
-
-    for logger_name in loggers:
-        try:
-            logging.getLogger(logger_name).setLevel(level)
-        except Exception:
-            # Package structure differences or missing loggers are non-fatal.
-            pass
+    # getLogger creates missing loggers on demand, so this cannot fail.
+    for logger_name in _SEARCH_LOGGERS:
+        logging.getLogger(logger_name).setLevel(level)
 
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when it is installed, else None.
+
+    The pipeline is dominated by HTTP round trips, which uvloop dispatches
+    faster than the stock selector loop. uvloop is an optional dependency,
+    installed with the ``performance`` extra on POSIX platforms only, so fall
+    back to asyncio's default loop when it is absent.
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return cast(Callable[[], asyncio.AbstractEventLoop], uvloop.new_event_loop)
+
+
 def _run_search_pipeline(config: SearchConfig, query: str, verbose: bool) -> None:
     """Create an event loop and execute the search pipeline.
 
@@ -197,48 +216,56 @@ def _run_search_pipeline(config: SearchConfig, query: str, verbose: bool) -> Non
             answer: str = result.get("answer", "No answer generated.")
             sources: list[dict[str, Any]] = result.get("source_chunks", [])
 
-            console.print(
+            # Render the answer and every source in a single print so Rich
+            # runs its render pipeline once per result page.
+            renderables: list[RenderableType] = [
                 Panel(
                     Markdown(answer),
-                    title="[bold green]:robot: Answer[/bold green]",
+                    title=ANSWER_PANEL_TITLE,
                     border_style="green",
-                )
-            )
-
-            # Display Sources
-            console.print(f"\n[bold]Sources Used ({len(sources)}):[/bold]")
+                ),
+                # Same markup and highlighting a direct console.print applied.
+                console.render_str(
+                    f"\n[bold]Sources Used ({len(sources)}):[/bold]", highlight=True
+                ),
+            ]
+            content_field = config.content_field
             for i, source in enumerate(sources):
                 score: float | str = source.get("_final_score", "N/A")
-                content_field = config.content_field
                 content_text: str = source.get(content_field, "")
+                # Only mark the preview as cut when something was cut.
                 content_sample = (
                     content_text[:CONTENT_SAMPLE_PREVIEW_LEN] + "..."
-                    if content_text
-                    else ""
+                    if len(content_text) > CONTENT_SAMPLE_PREVIEW_LEN
+                    else content_text
                 )
 
                 score_display = (
                     f"{score:.4f}" if isinstance(score, float) else str(score)
                 )
 
-                console.print(
+                renderables.append(
                     Panel(
                         content_sample,
-                        title=(
-                            f"[bold cyan]Chunk {i + 1} "
+                        # Plain Text: no markup parsing, and index values
+                        # containing "[" cannot be mistaken for style tags.
+                        title=Text(
+                            f"Chunk {i + 1} "
                             f"(Score: {score_display} | "
-                            f"Type: {source.get('_retrieval_type', 'N/A')})[/bold cyan]"
+                            f"Type: {source.get('_retrieval_type', 'N/A')})",
+                            style="bold cyan",
                         ),
                         border_style="cyan",
                         expand=False,
                     )
                 )
+            console.print(Group(*renderables))
 
         except ValueError as ve:
             console.print(
                 Panel(
                     f"Configuration failed: {ve}",
-                    title="[bold red]Error[/bold red]",
+                    title=ERROR_PANEL_TITLE,
                     border_style="red",
                 )
             )
@@ -254,7 +281,7 @@ def _run_search_pipeline(config: SearchConfig, query: str, verbose: bool) -> Non
                         f"Pipeline execution failed: {e}\n"
                         "[dim]Run with --verbose for details.[/dim]"
                     ),
-                    title="[bold red]Error[/bold red]",
+                    title=ERROR_PANEL_TITLE,
                     border_style="red",
                 )
             )
@@ -264,7 +291,7 @@ def _run_search_pipeline(config: SearchConfig, query: str, verbose: bool) -> Non
                 await pipeline.close()
                 logging.info("Pipeline clients closed.")
 
-    asyncio.run(_async_run())
+    asyncio.run(_async_run(), loop_factory=_event_loop_factory())
 
 
 @app.callback()
@@ -436,7 +463,8 @@ def run_search(
     dat_prompt: str = DEFAULT_DAT_PROMPT
     if dat_prompt_file:
         try:
-            with open(dat_prompt_file, "r") as f:
+            # utf-8-sig drops a leading BOM; text mode normalizes CRLF.
+            with open(dat_prompt_file, encoding="utf-8-sig") as f:
                 dat_prompt = f.read()
             logging.info(f"Loaded custom DAT prompt from {dat_prompt_file}")
         except FileNotFoundError:
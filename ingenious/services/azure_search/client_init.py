@@ -31,7 +31,10 @@ Usage:
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Mapping
 from importlib import import_module
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -52,18 +55,25 @@ __all__ = ["make_async_search_client", "make_async_openai_client"]
 # Constants
 # ─────────────────────────────────────────────────────────────────────────────
 LOGGER_NAME = "ingenious.services.azure_search.client_init"
+FACTORY_MODULE = "ingenious.client.azure"
 DEFAULT_OPENAI_MAX_RETRIES = 3
-ALLOWED_OPENAI_OPTION_KEYS: set[str] = {
-    "max_retries",
-    "timeout",
-    "connect_timeout",
-    "read_timeout",
-    "transport",
-    "http_client",
-}
+ALLOWED_OPENAI_OPTION_KEYS: frozenset[str] = frozenset(
+    {
+        "max_retries",
+        "timeout",
+        "connect_timeout",
+        "read_timeout",
+        "transport",
+        "http_client",
+    }
+)
 
 log = logging.getLogger(LOGGER_NAME)
 
+# (factory module, AzureClientFactory) from the last production lookup. Keyed
+# on the module object so a reloaded or evicted package is picked up again.
+_FACTORY_CACHE: tuple[ModuleType, Any] | None = None
+
 
 def _get_factory() -> Any:
     """Resolve and return the Azure client factory class.
@@ -74,17 +84,25 @@ def _get_factory() -> Any:
     Returns:
         The factory class used to create concrete Azure clients.
     """
+    global _FACTORY_CACHE
     if AzureClientFactory is not None:
         log.debug("Using patched AzureClientFactory: %s", AzureClientFactory)
         return AzureClientFactory
 
-    module = import_module("ingenious.client.azure")
+    # Reuse the resolved class while the same factory module is loaded; a
+    # sys.modules lookup is far cheaper than import_module on every client.
+    cached = _FACTORY_CACHE
+    if cached is not None and sys.modules.get(FACTORY_MODULE) is cached[0]:
+        return cached[1]
+
+    module = import_module(FACTORY_MODULE)
     _F = getattr(module, "AzureClientFactory")
     log.debug("Using production AzureClientFactory: %s", _F)
+    _FACTORY_CACHE = (module, _F)
     return _F
 
 
-def _normalize_openai_options(client_options: dict[str, Any]) -> dict[str, Any]:
+def _normalize_openai_options(client_options: Mapping[str, Any]) -> dict[str, Any]:
     """Normalize and validate options forwarded to the OpenAI client factory.
 
     Behavior/contract (mirrors test expectations):
@@ -94,7 +112,8 @@ def _normalize_openai_options(client_options: dict[str, Any]) -> dict[str, Any]:
     - Drop unknown kwargs silently (keep surface stable).
 
     Args:
-        client_options: Arbitrary keyword options supplied by callers.
+        client_options: Arbitrary keyword options supplied by callers. Only
+            read, never mutated, so callers need not pass a copy.
 
     Returns:
         A sanitized dict containing only supported keys with validated values.
@@ -103,25 +122,21 @@ def _normalize_openai_options(client_options: dict[str, Any]) -> dict[str, Any]:
         ValueError: If `max_retries`/`retries` specifies a negative value.
         ValueError: If a non-integer value is provided for retries.
     """
-    out: dict[str, Any] = {}
-
     # Normalize retries (support alias and default).
     raw_max = client_options.get("max_retries", client_options.get("retries", None))
     if raw_max is None:
         max_retries: int = DEFAULT_OPENAI_MAX_RETRIES
     else:
-        max_retries = int(raw_max)  # may raise ValueError; let it bubble
+        # Skip int() for plain ints; other values may raise ValueError.
+        max_retries = raw_max if type(raw_max) is int else int(raw_max)
     if max_retries < 0:
         raise ValueError("max_retries must be >= 0")
-    out["max_retries"] = max_retries
-
-    # Copy only allowed remaining options.
-    for k in ALLOWED_OPENAI_OPTION_KEYS:
-        if k == "max_retries":
-            continue
-        if k in client_options:
-            out[k] = client_options[k]
 
+    # Copy only allowed options; the keys view intersection runs in C.
+    out: dict[str, Any] = {
+        k: client_options[k] for k in client_options.keys() & ALLOWED_OPENAI_OPTION_KEYS
+    }
+    out["max_retries"] = max_retries
     return out
 
 
@@ -181,7 +196,7 @@ def make_async_openai_client(
         ValueError: If a negative retry count is provided or parsing fails.
     """
     factory = _get_factory()
-    normalized: dict[str, Any] = _normalize_openai_options(dict(client_options))
+    normalized: dict[str, Any] = _normalize_openai_options(client_options)
 
     return cast(
         "AsyncAzureOpenAI",
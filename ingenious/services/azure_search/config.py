@@ -12,6 +12,7 @@ instantiated to configure the search service.
 
 from __future__ import annotations
 
+import weakref
 from types import SimpleNamespace
 from typing import Optional
 
@@ -52,6 +53,12 @@ Respond ONLY with two integers separated by a single space. Do not include any o
 """
 
 
+# `SearchConfig.openai` namespaces, one per live instance. Kept outside the
+# model: a cached_property would be carried over stale by model_copy(update=...)
+# and instance attributes would take part in pydantic equality.
+_OPENAI_VIEWS: dict[int, SimpleNamespace] = {}
+
+
 class SearchConfig(BaseModel):
     """Configuration model for the Advanced Azure AI Search service.
 
@@ -132,15 +139,24 @@ class SearchConfig(BaseModel):
     # Back-compat convenience accessor expected by some call sites/tests.
     @property
     def openai(self) -> SimpleNamespace:
-        """Compatibility shim exposing OpenAI settings as a namespace."""
+        """Compatibility shim exposing OpenAI settings as a namespace.
+
+        The config is frozen, so the namespace is built once per instance.
+        """
+        view = _OPENAI_VIEWS.get(id(self))
+        if view is not None:
+            return view
         key_val = self.openai_key.get_secret_value()
-        return SimpleNamespace(
+        view = SimpleNamespace(
             endpoint=self.openai_endpoint,
             key=key_val,
             version=self.openai_version,
             embedding_deployment_name=self.embedding_deployment_name,
             generation_deployment_name=self.generation_deployment_name,
         )
+        _OPENAI_VIEWS[id(self)] = view
+        weakref.finalize(self, _OPENAI_VIEWS.pop, id(self), None)
+        return view
 
     class Config:
         """Pydantic model configuration.
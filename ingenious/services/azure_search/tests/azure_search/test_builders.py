@@ -14,6 +14,7 @@ internal helper `_pick_models`.
 from __future__ import annotations
 
 import logging
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -85,6 +86,40 @@ def test_build_search_config_maps_and_validates(monkeypatch: MonkeyPatch) -> Non
     }  # chosen from gen then emb
 
 
+def test_build_search_config_reuses_config_until_settings_change() -> None:
+    """Verify repeat builds from unchanged settings return the same config.
+
+    The builder memoizes its last result per settings object, but must rebuild
+    as soon as any input it reads has been changed in place.
+    """
+    models: list[ModelSettings] = [
+        ModelSettings(
+            model="text-embedding-3-small",
+            deployment="embed",
+            api_key="K1",
+            base_url="https://oai",
+        ),
+        ModelSettings(
+            model="gpt-4o", deployment="chat", api_key="K2", base_url="https://oai"
+        ),
+    ]
+    azure = AzureSearchSettings(
+        service="svc",
+        endpoint="https://search.windows.net",
+        key="SKEY",
+        index_name="idx",
+    )
+    settings = _settings(models, azure)
+
+    first = build_search_config_from_settings(settings)
+    assert build_search_config_from_settings(settings) is first
+
+    azure.index_name = "idx2"
+    rebuilt = build_search_config_from_settings(settings)
+    assert rebuilt is not first
+    assert rebuilt.search_index_name == "idx2"
+
+
 def test_build_search_config_errors() -> None:
     """Verify that ConfigError is raised for missing or invalid settings.
 
@@ -111,6 +146,46 @@ def test_build_search_config_errors() -> None:
         build_search_config_from_settings(_settings(models, azure2))
 
 
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("top_k_retrieval", None),
+        ("top_n_final", "5"),
+        ("id_field", None),
+        ("content_field", 1),
+        ("vector_field", None),
+    ],
+)
+def test_build_search_config_rejects_mistyped_service_fields(
+    field: str, value: object
+) -> None:
+    """Verify duck-typed service objects cannot smuggle bad field types through.
+
+    SearchConfig is built without re-validation, so the builder itself must
+    reject values that SearchConfig's field types would not accept.
+    """
+    models: list[ModelSettings] = [
+        ModelSettings(
+            model="text-embedding-3-small",
+            deployment="embed",
+            api_key="K1",
+            base_url="https://oai",
+        ),
+        ModelSettings(
+            model="gpt-4o", deployment="chat", api_key="K2", base_url="https://oai"
+        ),
+    ]
+    svc = SimpleNamespace(
+        endpoint="https://search.windows.net", key="SKEY", index_name="idx"
+    )
+    setattr(svc, field, value)
+    settings = IngeniousSettings.model_construct(
+        models=models, azure_search_services=[svc]
+    )
+    with pytest.raises(ConfigError, match=field):
+        build_search_config_from_settings(settings)
+
+
 def test_pick_models_selection_and_require_deployments(
     caplog: LogCaptureFixture,
 ) -> None:
@@ -19,6 +19,7 @@ from ingenious.services.azure_search.builders import ConfigError, _validate_endp
         "example.com",  # Missing scheme
         "ftp://example.com",  # Invalid scheme
         "https://",  # Missing host
+        "https://[bad",  # Unterminated IPv6 host
         "",  # Empty
         "  ",  # Whitespace
     ],
@@ -358,3 +358,27 @@ def test_make_async_openai_client_rejects_negative_max_retries(
 
     with pytest.raises(ValueError, match="max_retries must be >= 0"):
         client_init.make_async_openai_client(cfg, max_retries=-1)
+
+
+def test_get_factory_caches_until_factory_module_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    The production factory is resolved once per loaded `ingenious.client.azure`.
+
+    Swapping the module in `sys.modules` (as the eviction helper above does)
+    must invalidate the cached class rather than hand out a stale one.
+    """
+    client_init, _ = _reload_client_init_with_dummies(monkeypatch)
+
+    first = client_init._get_factory()
+    assert client_init._get_factory() is first
+
+    class _OtherFactory:
+        pass
+
+    replacement = types.ModuleType("ingenious.client.azure")
+    replacement.AzureClientFactory = _OtherFactory  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "ingenious.client.azure", replacement)
+
+    assert client_init._get_factory() is _OtherFactory
@@ -91,6 +91,31 @@ def test_search_config_is_frozen(config: SearchConfig) -> None:
         config.top_k_retrieval = 99  # type: ignore[misc]
 
 
+def test_openai_view_is_built_once_per_instance(config: SearchConfig) -> None:
+    """Verify the legacy `openai` namespace is cached per config instance.
+
+    Copies made with `model_copy(update=...)` must get their own namespace
+    reflecting the updated values, and cached entries must not outlive the
+    config they belong to.
+    """
+    import gc
+
+    from ingenious.services.azure_search import config as config_mod
+
+    view = config.openai
+    assert config.openai is view
+    assert view.key == "openai_key"
+    assert view.generation_deployment_name == "chat-deploy"
+
+    copy = config.model_copy(update={"generation_deployment_name": "chat2"})
+    assert copy.openai.generation_deployment_name == "chat2"
+
+    key = id(copy)
+    del copy
+    gc.collect()
+    assert key not in config_mod._OPENAI_VIEWS
+
+
 def test_default_dat_prompt_has_key_sections() -> None:
     """Sanity-check the content of the default DAT prompt.
 
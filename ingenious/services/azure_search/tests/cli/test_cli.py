@@ -15,6 +15,7 @@ helper functions `setup_logging` and `_run_search_pipeline`.
 from __future__ import annotations
 
 import logging
+import sys
 from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -24,7 +25,12 @@ import pytest
 import typer
 from typer.testing import CliRunner, Result
 
-from ingenious.services.azure_search.cli import _run_search_pipeline, app, setup_logging
+from ingenious.services.azure_search.cli import (
+    _event_loop_factory,
+    _run_search_pipeline,
+    app,
+    setup_logging,
+)
 from ingenious.services.azure_search.config import DEFAULT_DAT_PROMPT, SearchConfig
 
 if TYPE_CHECKING:
@@ -99,6 +105,25 @@ def test_run_search_pipeline_success(
     mock_pipe.close.assert_awaited()
 
 
+def test_run_search_pipeline_marks_only_truncated_previews(
+    config: SearchConfig, capsys: CaptureFixture[str]
+) -> None:
+    """Test that the ellipsis is only appended to previews that were cut."""
+    mock_pipe: MagicMock = MagicMock()
+    mock_pipe.get_answer = AsyncMock(
+        return_value={
+            "answer": "A",
+            "source_chunks": [{"id": "S", "content": "short chunk"}],
+        }
+    )
+    mock_pipe.close = AsyncMock()
+    with _patch_build_pipeline(MagicMock(return_value=mock_pipe)):
+        _run_search_pipeline(config, "q", verbose=False)
+    out: str = capsys.readouterr().out
+    assert "short chunk" in out
+    assert "short chunk..." not in out
+
+
 def test_run_search_pipeline_config_error(
     config: SearchConfig, capsys: CaptureFixture[str]
 ) -> None:
@@ -220,6 +245,16 @@ def test_cli_custom_dat_prompt_success(tmp_path: Path) -> None:
         assert rp.call_args[0][0].dat_prompt == "CUSTOM"
 
 
+def test_cli_custom_dat_prompt_strips_bom_and_crlf(tmp_path: Path) -> None:
+    """Test that a Windows-saved prompt file loads without BOM or CR characters."""
+    p: Path = tmp_path / "dat.txt"
+    p.write_bytes("\ufeffLINE1\r\nLINE2".encode("utf-8"))
+    with patch(f"{CLI_MOD}._run_search_pipeline") as rp:
+        res: Result = runner.invoke(app, ["q", "--dat-prompt-file", str(p)], env=ENV)
+        assert res.exit_code == 0
+        assert rp.call_args[0][0].dat_prompt == "LINE1\nLINE2"
+
+
 def test_cli_custom_dat_prompt_missing() -> None:
     """Test that a missing prompt file causes the CLI to exit with an error.
 
@@ -234,3 +269,11 @@ def test_cli_custom_dat_prompt_missing() -> None:
         assert res.exit_code == 1
         assert "DAT prompt file not found" in res.stdout
         rp.assert_not_called()
+
+
+def test_event_loop_factory_falls_back_without_uvloop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the default asyncio loop is used when uvloop is unavailable."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert _event_loop_factory() is None
@@ -147,3 +147,47 @@ def test_client_init_delegates_to_factory(monkeypatch: "MonkeyPatch") -> None:
     assert called["search"] is True
     assert called["openai"] is True
     assert sc is not None and oc is not None
+
+
+def test_token_cache_persistence_is_opt_in(monkeypatch: "MonkeyPatch") -> None:
+    """Persistent token caching is only requested when the env var is set."""
+    auth_mod: Any = cast(Any, _reload("ingenious.config.auth_config"))
+
+    monkeypatch.delenv("INGENIOUS_AZURE_TOKEN_CACHE_NAME", raising=False)
+    assert auth_mod._token_cache_kwargs() == {}
+
+    identity = types.ModuleType("azure.identity")
+
+    class TokenCachePersistenceOptions:  # noqa: N801
+        def __init__(self, *, name: str = "msal.cache", **_: Any) -> None:
+            self.name = name
+
+    identity.TokenCachePersistenceOptions = TokenCachePersistenceOptions  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "azure.identity", identity)
+    monkeypatch.setenv("INGENIOUS_AZURE_TOKEN_CACHE_NAME", "ingenious")
+    kwargs = auth_mod._token_cache_kwargs()
+    assert kwargs["cache_persistence_options"].name == "ingenious"
+
+
+def test_auth_config_auth_key_matches_equivalent_configs() -> None:
+    """Configs with the same auth fields share an auth_key for client caches."""
+    auth_mod: Any = cast(Any, _reload("ingenious.config.auth_config"))
+    AzureAuthConfig = auth_mod.AzureAuthConfig
+
+    a = AzureAuthConfig.from_config({"api_key": "K", "endpoint": "https://x"})
+    b = AzureAuthConfig.from_config({"key": "K", "url": "https://x"})
+    c = AzureAuthConfig.from_config({"api_key": "other", "endpoint": "https://x"})
+
+    assert a.auth_key() == b.auth_key()
+    assert a.auth_key() != c.auth_key()
+    assert len({a.auth_key(), b.auth_key(), c.auth_key()}) == 2
+
+
+def test_profile_models_keep_field_equality() -> None:
+    """Mixing in AzureAuthConfig must not replace BaseModel's field-wise __eq__."""
+    from ingenious.models.profile import ModelConfig
+
+    a = ModelConfig.model_construct(model="gpt-4o", base_url="https://x")
+    b = ModelConfig.model_construct(model="gpt-4o-mini", base_url="https://x")
+
+    assert a != b
@@ -1,5 +1,7 @@
 import csv
 import io
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List
 
 import jsonpickle  # type: ignore
@@ -35,45 +37,66 @@ def Get_Model_Properties(model: Any) -> List[FieldData]:
     return properties
 
 
+def _Row_Values(keys: List[str]) -> Any:
+    # itemgetter fetches every column in one call; it returns a bare value
+    # rather than a tuple when given a single key.
+    if len(keys) == 1:
+        get_one = itemgetter(keys[0])
+        return lambda row: (get_one(row),)
+    if not keys:
+        return lambda row: ()
+    return itemgetter(*keys)
+
+
 def Dict_To_Csv(obj: Dict[str, Any], row_header_columns: List[str], name: str) -> str:
     output: str = "``` csv\n"
     csv_output: io.StringIO = io.StringIO()
     writer = csv.writer(csv_output)
     writer.writerow(row_header_columns)
-    for row in obj.values():
-        writer.writerow([row[key] for key in row_header_columns])
+    writer.writerows(map(_Row_Values(row_header_columns), obj.values()))
     output += csv_output.getvalue() + "\n```"
     return output
 
 
+def _Row_As_Dict(row: Any) -> Any:
+    if isinstance(row, dict):
+        return row
+    try:
+        return row.__dict__
+    except Exception:
+        print(f"Could not convert {row} to dictionary")
+        return row
+
+
 def List_To_Csv(obj: List[Any], row_header_columns: List[str], name: str) -> str:
     output: str = "``` csv\n"
     csv_output: io.StringIO = io.StringIO()
     writer = csv.writer(csv_output)
     writer.writerow(row_header_columns)
-    for row in obj:
-        if not isinstance(row, dict):
-            try:
-                row = row.__dict__
-            except Exception:
-                print(f"Could not convert {row} to dictionary")
-        writer.writerow([row[key] for key in row_header_columns])
+    writer.writerows(map(_Row_Values(row_header_columns), map(_Row_As_Dict, obj)))
     output += csv_output.getvalue() + "\n```"
     return output
 
 
+# Row types are model classes reused across calls, so the header list is memoized.
+@lru_cache(maxsize=64)
+def _Listable_Csv_Headers(row_type: Any) -> tuple[str, ...]:
+    return tuple(
+        prop.FieldName
+        for prop in Get_Model_Properties(row_type)
+        if Is_Non_Complex_Field_Check_By_Type(prop.FieldType)
+    )
+
+
 def Listable_Object_To_Csv(obj: List[Any], row_type: Any) -> str:
     output: str = "``` csv\n"
     csv_output: io.StringIO = io.StringIO()
     writer = csv.writer(csv_output)
-    headers: List[str] = [
-        prop.FieldName
-        for prop in Get_Model_Properties(row_type)
-        if Is_Non_Complex_Field_Check_By_Type(prop.FieldType)
-    ]
+    headers = _Listable_Csv_Headers(
+        row_type if isinstance(row_type, type) else type(row_type)
+    )
     writer.writerow(headers)
-    for row in obj:
-        writer.writerow([getattr(row, header, None) for header in headers])
+    writer.writerows([getattr(row, header, None) for header in headers] for row in obj)
     output += csv_output.getvalue() + "\n```"
     return output
 
@@ -4,6 +4,8 @@ Simplified unit tests for the agent models that focus on what can actually be te
 
 from unittest.mock import Mock
 
+import pytest
+
 from ingenious.models.agent import Agent, AgentChat, AgentChats, Agents, LLMUsageTracker
 
 
@@ -198,3 +200,38 @@ class TestLLMUsageTracker:
             event_type="test_event",
         )
         assert isinstance(tracker, logging.Handler)
+
+    def test_get_chat_by_name_returns_first_queued_chat(self):
+        """Test that queued chats can be looked up by chat_name."""
+        tracker = LLMUsageTracker(
+            agents=Mock(),
+            config=Mock(),
+            chat_history_repository=Mock(),
+            revision_id="test_revision",
+            identifier="test_identifier",
+            event_type="test_event",
+        )
+        first = AgentChat(
+            chat_name="summary",
+            target_agent_name="summary",
+            source_agent_name="user_proxy",
+            user_message="",
+            system_prompt="",
+        )
+        second = first.model_copy()
+        for chat in (first, second):
+            agent = Mock()
+            agent.get_agent_chat_by_source.return_value = chat
+            tracker._update_agent_chat(
+                agent=agent,
+                source_name="user_proxy",
+                response="done",
+                system_input="",
+                user_input="",
+                event=Mock(prompt_tokens=1, completion_tokens=1),
+                add_chat=True,
+            )
+
+        assert tracker.get_chat_by_name("summary") is first
+        with pytest.raises(ValueError):
+            tracker.get_chat_by_name("missing")
@@ -18,11 +18,20 @@ from openai.types.chat.chat_completion import Choice
 from ingenious.common.enums import AuthenticationMethod
 from ingenious.errors.content_filter_error import ContentFilterError
 from ingenious.errors.token_limit_exceeded_error import TokenLimitExceededError
+from ingenious.external_services import openai_service
 from ingenious.external_services.openai_service import OpenAIService
 
 # --------------------------- helpers ---------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_shared_clients():
+    """Keep the module-level client cache from leaking between tests."""
+    openai_service._get_shared_client.cache_clear()
+    yield
+    openai_service._get_shared_client.cache_clear()
+
+
 def _make_client(
     *, return_value: Any | None = None, side_effect: Exception | None = None
 ) -> tuple[Any, Mock]:
@@ -105,6 +114,29 @@ class TestOpenAIService:
             assert service.model == model
             make_client.assert_called_once()
 
+    def test_init_reuses_client_for_identical_settings(self):
+        """Services with the same connection settings share one client."""
+        with patch(
+            "ingenious.external_services.openai_service.AzureClientFactory.create_openai_client_from_params",
+            side_effect=lambda **_: object(),
+        ) as make_client:
+            args = ("https://test.openai.azure.com/", "k", "2024-02-01", "gpt-4o")
+            first = OpenAIService(
+                *args, authentication_method=AuthenticationMethod.TOKEN
+            )
+            second = OpenAIService(
+                *args, authentication_method=AuthenticationMethod.TOKEN
+            )
+            other = OpenAIService(
+                *args,
+                deployment="other",
+                authentication_method=AuthenticationMethod.TOKEN,
+            )
+
+            assert first.client is second.client
+            assert other.client is not first.client
+            assert make_client.call_count == 2
+
     def test_init_missing_config(self):
         """Test OpenAI service initialization with missing configuration."""
         # Make the factory raise so we don't rely on real packages
@@ -147,6 +179,33 @@ class TestOpenAIService:
         assert response.role == "assistant"
         create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_generate_response_prepends_stable_prefix(self):
+        """The stable prefix is sent first and caller lists are not mutated."""
+        mock_message = ChatCompletionMessage(role="assistant", content="ok")
+        mock_response = ChatCompletion(
+            id="test_id",
+            choices=[Choice(index=0, message=mock_message, finish_reason="stop")],
+            created=1234567890,
+            model="gpt-4o-mini",
+            object="chat.completion",
+        )
+        client, create = _make_client(return_value=mock_response)
+        service = OpenAIService(
+            "https://test.openai.azure.com/",
+            "k",
+            "2023-03-15-preview",
+            "gpt-4o-mini",
+            client=client,
+        )
+
+        prefix = [{"role": "system", "content": "You are helpful."}]
+        messages = [{"role": "user", "content": "Hello"}]
+        await service.generate_response(messages=messages, stable_prefix=prefix)
+
+        assert create.call_args.kwargs["messages"] == prefix + messages
+        assert len(prefix) == 1 and len(messages) == 1
+
     @pytest.mark.asyncio
     async def test_generate_response_success_openai(self):
         """Same as Azure path; DI client drives behavior."""
@@ -210,6 +210,14 @@ class TestListToCsv:
             call_args = mock_print.call_args[0][0]
             assert "Could not convert" in call_args
 
+    def test_list_to_csv_single_column(self):
+        """Test List_To_Csv with a single header column"""
+        data = [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
+
+        result = List_To_Csv(data, ["name"], "test")
+
+        assert result == "``` csv\nname\r\nAlice\r\nBob\r\n\n```"
+
     def test_list_to_csv_empty_list(self):
         """Test List_To_Csv with empty list"""
         data = []